@@ -1,5 +1,10 @@
 from __future__ import annotations
-from typing import Any
+from typing import Any, Callable, Optional
+import heapq
+
+_heappush = heapq.heappush
+_heappop = heapq.heappop
+_heapify = heapq.heapify
 
 
 class Container:
@@ -7,6 +12,7 @@ class Container:
 
     This is an abstract class. Only child classes should be instantiated.
     """
+    __slots__ = ()
 
     def add(self, item: Any) -> None:
         """Add <item> to this Container.
@@ -32,30 +38,43 @@ class PriorityQueue(Container):
     meaning the item which was inserted *earlier* is the first one to be
     removed.
 
-    If x < y, then x has a *HIGHER* priority than y.
+    If x < y, then x has a *HIGHER* priority than y. If the queue was given
+    a key function, items are compared by their keys instead.
 
     Attributes:
-    - _items: The items stored in the priority queue. The highest priority item
-              is at index 0.
+    - _items: A binary min-heap of (priority key, insertion order, item)
+              tuples. The highest priority item is at index 0.
+    - _counter: The insertion order to assign to the next added item.
+    - _key: The function used to compute each item's priority key, or None
+            if items are compared directly.
 
     Representation Invariants:
-    - self._items == sorted(self._items, reverse=True)
-    - all objects in self._items can be compared to each other using
+    - self._items satisfies the heap invariant maintained by heapq
+    - all priority keys in self._items can be compared to each other using
       comparison operators
     """
     _items: list
+    _counter: int
+    _key: Optional[Callable[[Any], Any]]
+    __slots__ = ('_items', '_counter', '_key')
+
+    def __init__(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        """Initialize an empty PriorityQueue that orders items by <key>, or by
+        the items themselves if <key> is None.
 
-    def __init__(self) -> None:
-        """Initialize an empty PriorityQueue.
+        >>> pq = PriorityQueue(key=len)
+        >>> pq.add('fred')
+        >>> pq.add('ann')
+        >>> pq.remove()
+        'ann'
         """
         self._items = []
+        self._counter = 0
+        self._key = key
 
     def __str__(self) -> str:
         """Return a string representation of the PriorityQueue"""
-        str_rep = ''
-        for event in self._items:
-            str_rep += str(event) + '\n'
-        return str_rep
+        return ''.join(f'{event}\n' for _, _, event in sorted(self._items))
 
     def remove(self) -> Any:
         """Remove and return the next item from this PriorityQueue.
@@ -77,7 +96,7 @@ class PriorityQueue(Container):
         >>> pq.remove()
         'mona'
         """
-        return self._items.pop(0)
+        return _heappop(self._items)[2]
 
     def is_empty(self) -> bool:
         """
@@ -90,7 +109,7 @@ class PriorityQueue(Container):
         >>> pq.is_empty()
         False
         """
-        return len(self._items) == 0
+        return not self._items
 
     def add(self, item: Any) -> None:
         """Add <item> to this PriorityQueue.
@@ -100,21 +119,38 @@ class PriorityQueue(Container):
         >>> pq.add('anna')
         >>> pq.add('sophia')
         >>> pq.add('mona')
-        >>> pq._items
+        >>> pq.remove()
+        'anna'
+        >>> pq.remove()
+        'fred'
+        """
+        key = self._key
+        priority = item if key is None else key(item)
+        _heappush(self._items, (priority, self._counter, item))
+        self._counter += 1
+
+    def add_all(self, items: list) -> None:
+        """Add every item in <items> to this PriorityQueue, in order.
+
+        This is equivalent to calling add on each item, but rebuilds the heap
+        once instead of inserting the items one at a time.
+
+        >>> pq = PriorityQueue()
+        >>> pq.add('fred')
+        >>> pq.add_all(['sophia', 'anna', 'mona'])
+        >>> [pq.remove() for _ in range(4)]
         ['anna', 'fred', 'mona', 'sophia']
         """
-        if self.is_empty():
-            self._items.append(item)
+        start = self._counter
+        key = self._key
+        if key is None:
+            self._items.extend((item, start + i, item)
+                               for i, item in enumerate(items))
         else:
-            added = False
-            i = 0
-            while not added and i < len(self._items):
-                if item < self._items[i]:
-                    self._items.insert(i, item)
-                    added = True
-                i += 1
-            if not added:
-                self._items.append(item)
+            self._items.extend((key(item), start + i, item)
+                               for i, item in enumerate(items))
+        self._counter = start + len(items)
+        _heapify(self._items)
 
 
 if __name__ == '__main__':
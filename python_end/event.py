@@ -280,10 +280,8 @@ def create_event_list(event_file: TextIO) -> list[Event]:
         event_type = keywords[1]
         if event_type == "Arrive":
             customer = keywords[2]
-            items = []
-            for i in range(3, len(keywords), 2):
-                item = Item(keywords[i], int(keywords[i + 1]))
-                items.append(item)
+            items = [Item(keywords[i], int(keywords[i + 1]))
+                     for i in range(3, len(keywords), 2)]
             event = CustomerArrival(timestamp, Customer(customer, items))
             event_list.append(event)
         if event_type == "Close":
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TextIO
 from event import (Event, create_event_list, CheckoutCompleted)
 from store import GroceryStore
 from container import PriorityQueue
 
+# Events are ordered by timestamp, so the event queue compares the integer
+# timestamps directly instead of calling Event's comparison methods.
+_EVENT_KEY = attrgetter('timestamp')
+
 
 class GroceryStoreSimulation:
     """A Grocery Store simulation.
 
     Attributes:
     - _events: A sequence of events arranged in priority order determined by
-            the event comparison methods. For any two events e1 and e2,
-            if e1 < e2 then e1 will come out of the event queue before e2.
-            If e1 == e2 (according to the event comparison defined by __eq__),
-            then the event that was inserted *earlier* is the first one to be
-            removed.
+            the event timestamps. For any two events e1 and e2,
+            if e1 has an earlier timestamp than e2 then e1 will come out of
+            the event queue before e2. Events with equal timestamps come out
+            in the order they were inserted.
     - _store: The store being simulated.
     - stats: Summary statistics for the simulation, with these keys and values:
             'num_customers': the total number of customers in the simulation
@@ -43,7 +47,7 @@ class GroceryStoreSimulation:
         - store_file is open
         - All values in store_file are >= 0
         """
-        self._events = PriorityQueue()
+        self._events = PriorityQueue(key=_EVENT_KEY)
         self._store = GroceryStore(store_file)
         self.stats = {'num_customers': 0, 'total_time': 0, 'max_wait': 0}
 
@@ -62,9 +66,8 @@ class GroceryStoreSimulation:
           made to close when there are remaining customers.
         """
 
-        self._events = PriorityQueue()
-        for event in initial_events:
-            self._events.add(event)
+        self._events = PriorityQueue(key=_EVENT_KEY)
+        self._events.add_all(initial_events)
         checked_out = []
         current_time = 0
         while not self._events.is_empty():
@@ -3,7 +3,9 @@ This file contains all the classes necessary to model the relevant entities
 in a grocery store.
 """
 from __future__ import annotations
+from collections import deque
 from typing import TextIO
+import heapq
 import json
 
 # The maximum number of items a customer can have if they use an express line.
@@ -28,6 +30,9 @@ class GroceryStore:
     - num_lines: How many lines this grocery store has.
     - line_capacity: The capacity of each check out line.
     - checkout_lines: A list of all checkout lines in the store.
+    - _open_heap: A min-heap of (queue length, line index) entries for the
+      open checkout lines. An entry is stale if the line has since closed or
+      changed length; stale entries are discarded lazily.
 
     Pre-condition:
     - self.num_lines > 0.
@@ -41,6 +46,7 @@ class GroceryStore:
     num_lines: int
     line_capacity: int
     checkout_lines: list[CheckoutLine]
+    _open_heap: list[tuple[int, int]]
 
     def __init__(self, config_file: TextIO) -> None:
         """Initialize a GroceryStore from a configuration file <config_file>.
@@ -57,14 +63,31 @@ class GroceryStore:
         self_serve_count = json_dict['self_serve_count']
         self.num_lines = reg_count + express_count + self_serve_count
         self.line_capacity = json_dict['line_capacity']
-        checkout_lines = []
-        for _ in range(reg_count):
-            checkout_lines.append(RegularLine(self.line_capacity))
-        for _ in range(express_count):
-            checkout_lines.append(ExpressLine(self.line_capacity))
-        for _ in range(self_serve_count):
-            checkout_lines.append(SelfServeLine(self.line_capacity))
-        self.checkout_lines = checkout_lines
+        capacity = self.line_capacity
+        self.checkout_lines = (
+            [RegularLine(capacity) for _ in range(reg_count)]
+            + [ExpressLine(capacity) for _ in range(express_count)]
+            + [SelfServeLine(capacity) for _ in range(self_serve_count)])
+        self._open_heap = [(0, i) for i in range(self.num_lines)]
+
+    def _push_line(self, line_number: int) -> None:
+        """Record the current length of checkout line <line_number> in
+        self._open_heap, if the line is open.
+
+        Rebuild the heap from scratch if stale entries have piled up.
+
+        Preconditions:
+        - 0 <= line_number < self.num_lines
+        """
+        heap = self._open_heap
+        line = self.checkout_lines[line_number]
+        if line.is_open:
+            heapq.heappush(heap, (len(line), line_number))
+        if len(heap) > 2 * self.num_lines:
+            heap[:] = [(len(line), i)
+                       for i, line in enumerate(self.checkout_lines)
+                       if line.is_open]
+            heapq.heapify(heap)
 
     def enter_line(self, customer: Customer) -> int:
         """Pick a new line for <customer> to join, using the algorithm from
@@ -78,17 +101,28 @@ class GroceryStore:
         Preconditions:
         - customer is not currently in any line in this GroceryStore
         """
-        line_index = self.num_lines
-        position = self.line_capacity
-        for i in range(self.num_lines):
-            if self.checkout_lines[i].can_accept(customer):
-                if len(self.checkout_lines[i]) < position:
-                    position = len(self.checkout_lines[i])
-                    line_index = i
-        if line_index < self.num_lines:
-            self.checkout_lines[line_index].accept(customer)
-            return line_index
-        raise NoAvailableLineError
+        heap = self._open_heap
+        while heap and not self._is_current(heap[0]):
+            heapq.heappop(heap)
+        if not heap:
+            raise NoAvailableLineError
+        line_index = heap[0][1]
+        line = self.checkout_lines[line_index]
+        # All lines share one capacity, so if the shortest open line can't
+        # take the customer, none can.
+        if not line.can_accept(customer):
+            raise NoAvailableLineError
+        line.accept(customer)
+        self._push_line(line_index)
+        return line_index
+
+    def _is_current(self, entry: tuple[int, int]) -> bool:
+        """Return True iff the (queue length, line index) <entry> from
+        self._open_heap still describes an open line with that length.
+        """
+        length, line_number = entry
+        line = self.checkout_lines[line_number]
+        return line.is_open and len(line) == length
 
     def next_checkout_time(self, line_number: int) -> int:
         """Return the time it will take to check out the customer at the front
@@ -108,7 +142,9 @@ class GroceryStore:
         Preconditions:
         - 0 <= line_number < self.num_lines
         """
-        return self.checkout_lines[line_number].remove_front_customer()
+        remaining = self.checkout_lines[line_number].remove_front_customer()
+        self._push_line(line_number)
+        return remaining
 
     def close_line(self, line_number: int) -> list[Customer]:
         """Close checkout line <line_number> by updating its status to indicate
@@ -143,6 +179,8 @@ class Customer:
     - arrival_time: The first time this customer arrived at the checkout area
       and attempted to join a line, or None if they have not yet arrived.
     - _items: The items this customer has.
+    - _item_time: The total checkout time of the items this customer has.
+    - _num_items: The number of items this customer has.
     _checkout_time: the timestamp this customer was checked out.
 
     Representation Invariants:
@@ -152,6 +190,10 @@ class Customer:
     arrival_time: int | None
     checkout_time: int | None
     _items: list[Item]
+    _item_time: int
+    _num_items: int
+    __slots__ = ('name', 'arrival_time', 'checkout_time', '_items',
+                 '_item_time', '_num_items')
 
     def __init__(self, name: str, items: list[Item]) -> None:
         """Initialize a customer with the given <name> and a copy of the
@@ -173,13 +215,13 @@ class Customer:
         self.name = name
         self.arrival_time = None
         self.checkout_time = None
-        self._items = []
-        for i in range(len(items)):
-            self._items.append(items[i])
+        self._items = list(items)
+        self._item_time = sum(item.time for item in self._items)
+        self._num_items = len(self._items)
 
     def __str__(self) -> str:
         """Return a string representation of the customer"""
-        return (f'{self.name} ({len(self._items)} items), '
+        return (f'{self.name} ({self.num_items()} items), '
                 f'total checkout time: {self.item_time()}s')
 
     def num_items(self) -> int:
@@ -189,7 +231,7 @@ class Customer:
         >>> c.num_items()
         2
         """
-        return len(self._items)
+        return self._num_items
 
     def item_time(self) -> int:
         """Return the number of seconds it takes for a cashier to check out
@@ -200,10 +242,7 @@ class Customer:
         >>> c.item_time()
         10
         """
-        time = 0
-        for item in self._items:
-            time += item.time
-        return time
+        return self._item_time
 
 
 class Item:
@@ -218,6 +257,7 @@ class Item:
     """
     name: str
     time: int
+    __slots__ = ('name', 'time')
 
     def __init__(self, name: str, time: int) -> None:
         """Initialize a new item with <name> and <time>.
@@ -244,15 +284,22 @@ class CheckoutLine:
     - capacity: The maximum number of customers allowed in this CheckoutLine.
     - is_open: True iff the line is open.
     - _queue: Customers in this line in order by arrival time, with the
-                earliest arrival at the front of the list.
+                earliest arrival at the front of the deque.
+    - _n: The number of customers in this line.
+    - _time_multiplier: How many times longer than a cashier this line takes
+                        to check out a customer's items.
 
     Representation Invariants:
     - len(self) <= self.capacity
     - capacity > 0
+    - self._n == len(self._queue)
     """
     capacity: int
     is_open: bool
-    _queue: list[Customer]
+    _queue: deque[Customer]
+    _n: int
+    __slots__ = ('capacity', 'is_open', '_queue', '_n')
+    _time_multiplier = 1
 
     def __init__(self, capacity: int) -> None:
         """Initialize an open and empty CheckoutLine, with the given <capacity>.
@@ -266,10 +313,11 @@ class CheckoutLine:
         >>> line.is_open
         True
         >>> line._queue
-        []
+        deque([])
         """
         self.capacity = capacity
-        self._queue = []
+        self._queue = deque()
+        self._n = 0
         self.is_open = True
 
     def __len__(self) -> int:
@@ -279,12 +327,21 @@ class CheckoutLine:
         >>> len(line)
         0
         """
-        return len(self._queue)
+        return self._n
 
-    def __str__(self) -> None:
-        """ Return a string representation of a CheckoutLine queue """
-        return f'{[customer.name + str(customer.arrival_time) for customer in 
-                   self._queue]} '
+    def __str__(self) -> str:
+        """ Return a string representation of a CheckoutLine queue
+
+        >>> line = CheckoutLine(2)
+        >>> c = Customer('Ana', [])
+        >>> c.arrival_time = 4
+        >>> line.accept(c)
+        True
+        >>> str(line)
+        '[Ana4] '
+        """
+        return '[' + ', '.join(f'{customer.name}{customer.arrival_time}'
+                               for customer in self._queue) + '] '
 
     def can_accept(self, customer: Customer) -> bool:
         """Return True iff this CheckoutLine can accept <customer>.
@@ -293,7 +350,7 @@ class CheckoutLine:
         >>> line.can_accept(Customer('Sophia', []))
         True
         """
-        if len(self._queue) < self.capacity and self.is_open:
+        if self._n < self.capacity and self.is_open:
             return True
         return False
 
@@ -314,21 +371,27 @@ class CheckoutLine:
         >>> line.first_in_line() is c1
         True
         """
-        if self.can_accept(customer):
+        if self._n < self.capacity and self.is_open:
             self._queue.append(customer)
+            self._n += 1
             return True
         return False
 
     def next_checkout_time(self) -> int:
         """Return the time it will take to check out the customer at the front
-        of this line.
-
-        Preconditions:
-        - self.first_in_line() is not None
+        of this line, or 0 if the line is empty.
 
-        No doctests provided, since this method is abstract.
+        >>> line = CheckoutLine(1)
+        >>> line.next_checkout_time()
+        0
+        >>> line.accept(Customer('Bo', [Item('bananas', 7), Item('gum', 3)]))
+        True
+        >>> line.next_checkout_time()
+        10
         """
-        raise NotImplementedError
+        if not self._queue:
+            return 0
+        return self._time_multiplier * self._queue[0].item_time()
 
     def remove_front_customer(self) -> int:
         """If there is any customer (or customers) in this checkout line,
@@ -344,13 +407,11 @@ class CheckoutLine:
         >>> line.remove_front_customer() # It's still okay to call the method.
         0
         """
-        if len(self) == 0:
+        if not self._queue:
             return 0
-        queue = []
-        for i in range(1, len(self)):
-            queue.append(self._queue[i])
-        self._queue = queue
-        return len(self._queue)
+        self._queue.popleft()
+        self._n -= 1
+        return self._n
 
     def close(self) -> list[Customer]:
         """Close this line by updating its status to indicate that it is closed
@@ -364,16 +425,23 @@ class CheckoutLine:
         []
         >>> line.is_open
         False
+        >>> line = CheckoutLine(3)
+        >>> for name in ['Ana', 'Bo', 'Cy']:
+        ...     _ = line.accept(Customer(name, []))
+        >>> [customer.name for customer in line.close()]
+        ['Bo', 'Cy']
+        >>> line.first_in_line().name
+        'Ana'
         """
         self.is_open = False
-        queue = []
-        for i in range(1, len(self)):
-            queue.append(self._queue[i])
-        if len(self) == 0:
-            self._queue = []
-        else:
-            self._queue = [self._queue[0]]
-        return queue
+        if not self._queue:
+            return []
+        first = self._queue.popleft()
+        rest = list(self._queue)
+        self._queue.clear()
+        self._queue.append(first)
+        self._n = 1
+        return rest
 
     def first_in_line(self) -> Customer | None:
         """Return the first customer in this line, or None if there are no
@@ -385,28 +453,15 @@ class CheckoutLine:
         >>> line.first_in_line() is None
         True
         """
-        if len(self) == 0:
-            return None
-        return self._queue[0]
+        return self._queue[0] if self._queue else None
 
 
 class RegularLine(CheckoutLine):
     """A regular CheckoutLine.
     """
-    def next_checkout_time(self) -> int:
-        """Return the time it will take to check out the customer at the front
-        of this regular line.
-
-        Preconditions:
-        - self.first_in_line() is not None
-        Representational Invariants(RIs):
-        - self.next_checkout_time == 1 * self.first_in_line().item_time()
-        """
-        if len(self) == 0:
-            return 0
-        return self.first_in_line().item_time()
+    __slots__ = ()
 
-    def __str__(self) -> None:
+    def __str__(self) -> str:
         """ Return a string representation of a CheckoutLine queue """
         return f'[Reg]: {CheckoutLine.__str__(self)}'
 
@@ -414,41 +469,21 @@ class RegularLine(CheckoutLine):
 class ExpressLine(CheckoutLine):
     """An express CheckoutLine.
     """
-    def next_checkout_time(self) -> int:
-        """Return the time it will take to check out the customer at the front
-        of this express line.
+    __slots__ = ()
 
-        Preconditions:
-        - self.first_in_line() is not None
-        Representational Invariants(RIs):
-        - self.next_checkout_time == 1 * self.first_in_line().item_time()
-        """
-        if len(self) == 0:
-            return 0
-        return self.first_in_line().item_time()
-
-    def __str__(self) -> None:
+    def __str__(self) -> str:
         """ Return a string representation of a CheckoutLine queue """
         return f'[Exp]: {CheckoutLine.__str__(self)}'
 
 
 class SelfServeLine(CheckoutLine):
-    """A self-serve CheckoutLine.
+    """A self-serve CheckoutLine, where checking out takes twice as long as
+    at a regular or express line.
     """
-    def next_checkout_time(self) -> int:
-        """Return the time it will take to check out the customer at the front
-        of this regular line.
+    __slots__ = ()
+    _time_multiplier = 2
 
-        Preconditions:
-        - self.first_in_line() is not None
-        Representational Invariants(RIs):
-        - self.next_checkout_time == 2 * self.first_in_line().item_time()
-        """
-        if len(self) == 0:
-            return 0
-        return 2 * self.first_in_line().item_time()
-
-    def __str__(self) -> None:
+    def __str__(self) -> str:
         """ Return a string representation of a CheckoutLine queue """
         return f'[Slf]: {CheckoutLine.__str__(self)}'
 
@@ -19,32 +19,33 @@ class TestPriorityQueue():
     def test_add_to_empty_priority_queue(self) -> None:
         pq = PriorityQueue()
         pq.add('test')
-        assert pq._items == ['test']
+        assert pq.remove() == 'test'
+        assert pq.is_empty() is True
 
     def test_add_in_order_priority_queue(self) -> None:
         pq = PriorityQueue()
         pq.add('test')
         pq.add('test2')
-        assert pq._items == ['test', 'test2']
+        assert [pq.remove(), pq.remove()] == ['test', 'test2']
 
     def test_add_shuffled_priority_queue(self) -> None:
         pq = PriorityQueue()
         pq.add('test2')
         pq.add('test1')
-        assert pq._items == ['test1', 'test2']
+        assert [pq.remove(), pq.remove()] == ['test1', 'test2']
 
     def test_add_equal_elements_priority_queue(self) -> None:
         pq = PriorityQueue()
         pq.add('test')
         pq.add('test')
-        assert pq._items == ['test', 'test']
+        assert [pq.remove(), pq.remove()] == ['test', 'test']
 
     def test_add_to_middle_priority_queue(self) -> None:
         pq = PriorityQueue()
         pq.add('test1')
         pq.add('test3')
         pq.add('test2')
-        assert pq._items == ['test1', 'test2', 'test3']
+        assert [pq.remove() for _ in range(3)] == ['test1', 'test2', 'test3']
 
     def test_remove_return_priority_queue(self) -> None:
         pq = PriorityQueue()
@@ -53,13 +54,54 @@ class TestPriorityQueue():
         pq.add(0.9)
         assert pq.remove() == 0.9
 
+    def test_remove_equal_priority_fifo(self) -> None:
+        first = [1]
+        second = [1]
+        pq = PriorityQueue()
+        pq.add(first)
+        pq.add(second)
+        assert pq.remove() is first
+        assert pq.remove() is second
+
     def test_remove_priority_queue(self) -> None:
         pq = PriorityQueue()
         pq.add(1)
         pq.add(2)
         pq.add(0.9)
         pq.remove()
-        assert pq._items == [1, 2]
+        assert [pq.remove(), pq.remove()] == [1, 2]
+
+    def test_add_all_priority_queue(self) -> None:
+        pq = PriorityQueue()
+        pq.add(2)
+        pq.add_all([3, 1, 2])
+        assert [pq.remove() for _ in range(4)] == [1, 2, 2, 3]
+
+    def test_add_all_equal_priority_fifo(self) -> None:
+        first = [1]
+        second = [1]
+        third = [1]
+        pq = PriorityQueue()
+        pq.add(first)
+        pq.add_all([second, third])
+        assert pq.remove() is first
+        assert pq.remove() is second
+        assert pq.remove() is third
+
+    def test_key_priority_queue(self) -> None:
+        pq = PriorityQueue(key=len)
+        pq.add('ccc')
+        pq.add('a')
+        pq.add_all(['bb', 'd'])
+        assert [pq.remove() for _ in range(4)] == ['a', 'd', 'bb', 'ccc']
+
+    def test_key_does_not_compare_items(self) -> None:
+        pq = PriorityQueue(key=lambda item: item[0])
+        pq.add((1, {}))
+        pq.add((1, {}))
+        pq.add((0, {}))
+        assert pq.remove() == (0, {})
+        assert pq.remove() == (1, {})
 
 
 if __name__ == '__main__':
@@ -2,9 +2,10 @@
 Tests for the grocery store simulation.
 """
 from io import StringIO
+import pytest
 from simulation import GroceryStoreSimulation
 from event import create_event_list
-from store import GroceryStore, Customer, Item
+from store import GroceryStore, Customer, Item, NoAvailableLineError
 from store import RegularLine, ExpressLine, SelfServeLine
 
 
@@ -80,7 +81,41 @@ def test_simulation_close() -> None:
     assert gss.stats == {'num_customers': 2, 'total_time': 18, 'max_wait': 8}
 
 
-if __name__ == '__main__':
-    import pytest
+CONFIG_FILE_MIXED = '''{
+  "regular_count": 2,
+  "express_count": 1,
+  "self_serve_count": 1,
+  "line_capacity": 2
+}
+'''
+
 
+def test_enter_line_picks_shortest_lowest_index() -> None:
+    store = GroceryStore(StringIO(CONFIG_FILE_MIXED))
+    indices = [store.enter_line(Customer(str(i), [Item('gum', 1)]))
+               for i in range(8)]
+    assert indices == [0, 1, 2, 3, 0, 1, 2, 3]
+
+
+def test_enter_line_after_remove_and_close() -> None:
+    store = GroceryStore(StringIO(CONFIG_FILE_MIXED))
+    for i in range(4):
+        store.enter_line(Customer(str(i), [Item('gum', 1)]))
+    store.close_line(0)
+    store.remove_front_customer(2)
+    assert store.enter_line(Customer('a', [Item('gum', 1)])) == 2
+    assert store.enter_line(Customer('b', [Item('gum', 1)])) == 1
+
+
+def test_enter_line_all_lines_full() -> None:
+    store = GroceryStore(StringIO(CONFIG_FILE_MIXED))
+    for i in range(8):
+        store.enter_line(Customer(str(i), [Item('gum', 1)]))
+    with pytest.raises(NoAvailableLineError):
+        store.enter_line(Customer('late', [Item('gum', 1)]))
+    store.remove_front_customer(3)
+    assert store.enter_line(Customer('next', [Item('gum', 1)])) == 3
+
+
+if __name__ == '__main__':
     pytest.main(['test_project.py'])